@@ -1,6 +1,8 @@
 # src/eigenangi/config.py
 from __future__ import annotations
 
+import importlib.util
+from functools import lru_cache
 from os import PathLike
 from pathlib import Path
 from typing import Any, Dict, Optional, Union, IO, cast
@@ -30,26 +32,87 @@ except ModuleNotFoundError:  # Python 3.9–3.10
     import tomli as tomllib
 
 
+_dotenv_loaded = False
+
+
 def load_env_files() -> None:
-    """Load environment variables from a .env if present (no-op if absent)."""
+    """Load environment variables from a .env if present (no-op if absent).
+
+    The .env search walks up from the CWD, so it only runs once per process.
+    """
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
     load_dotenv()
+    _dotenv_loaded = True
+
+
+def reload_env_files() -> None:
+    """Re-read .env and drop the cached AWS settings (for long-lived processes)."""
+    global _dotenv_loaded
+    _dotenv_loaded = False
+    load_env_files()
+    resolved_aws_settings.cache_clear()
+
+
+def _config_dir() -> Path:
+    return Path.home() / ".config" / "eigenangi"
+
+
+@lru_cache(maxsize=1)
+def _parse_toml_config(cfg_path: Path, mtime_ns: int) -> Dict[str, str]:
+    """Parse the [aws] section; cached per (path, mtime) so edits are picked up."""
+    with cfg_path.open("rb") as f:
+        data = cast("dict[str, Any]", tomllib.load(f))
+    section = cast("dict[str, Any]", data.get("aws", {}))
+    return {k.upper(): str(v) for k, v in section.items()}
+
+
+@lru_cache(maxsize=1)
+def _exec_py_config(cfg_path: Path, mtime_ns: int) -> Dict[str, str]:
+    """Execute config.py and return its AWS dict; cached per (path, mtime)."""
+    spec = importlib.util.spec_from_file_location("_eigenangi_user_config", cfg_path)
+    if spec is None or spec.loader is None:
+        return {}
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    section = getattr(module, "AWS", None)
+    if not isinstance(section, dict):
+        return {}
+    return {str(k).upper(): str(v) for k, v in section.items()}
 
 
 def load_toml_config() -> Dict[str, str]:
-    """Read ~/.config/eigenangi/config.toml [aws] and return upper-cased keys."""
-    cfg_path = Path.home() / ".config" / "eigenangi" / "config.toml"
-    if cfg_path.exists():
-        with cfg_path.open("rb") as f:
-            data = cast("dict[str, Any]", tomllib.load(f))
-        section = cast("dict[str, Any]", data.get("aws", {}))
-        return {k.upper(): str(v) for k, v in section.items()}
+    """
+    Read ~/.config/eigenangi/config.toml [aws] and return upper-cased keys.
+
+    If ~/.config/eigenangi/config.py exists it is used instead: it must define
+    an ``AWS`` dict (e.g. ``AWS = {"AWS_DEFAULT_REGION": "ap-south-1"}``).
+    Loading it goes through Python's bytecode cache, which is cheaper than
+    parsing TOML on every start.
+    """
+    cfg_dir = _config_dir()
+    for cfg_path, loader in (
+        (cfg_dir / "config.py", _exec_py_config),
+        (cfg_dir / "config.toml", _parse_toml_config),
+    ):
+        try:
+            mtime_ns = cfg_path.stat().st_mtime_ns
+        except OSError:
+            continue
+        return loader(cfg_path, mtime_ns)
     return {}
 
 
+@lru_cache(maxsize=1)
 def resolved_aws_settings() -> Dict[str, Optional[str]]:
     """
     Resolve AWS settings from env/.env/config.toml.
     Returns a dict with AWS_* keys (values may be None).
+
+    The result is cached for the life of the process; call
+    ``resolved_aws_settings.cache_clear()`` to force re-resolution.
+    Callers must treat the returned dict as read-only.
     """
     load_env_files()
     toml_cfg = load_toml_config()
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..utils import getenv_str
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def cache_dir() -> Path:
+    return Path.home() / ".cache" / "eigenangi"
+
+
+def ttl_seconds() -> int:
+    """TTL for cached entries; override with EIGENANGI_CACHE_TTL (seconds)."""
+    raw = getenv_str("EIGENANGI_CACHE_TTL")
+    if raw is None:
+        return DEFAULT_TTL_SECONDS
+    try:
+        return int(raw)
+    except ValueError:
+        return DEFAULT_TTL_SECONDS
+
+
+def make_key(region: str, filters: Dict[str, Any]) -> str:
+    payload = region + "|" + json.dumps(filters, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load(key: str) -> Optional[List[Dict[str, Any]]]:
+    """Return cached rows for `key`, or None if missing, stale or unreadable."""
+    ttl = ttl_seconds()
+    if ttl <= 0:
+        return None
+    path = cache_dir() / f"{key}.json"
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        if time.time() - float(data["mtime"]) > ttl:
+            return None
+        rows = data["rows"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return rows if isinstance(rows, list) else None
+
+
+def store(key: str, rows: List[Dict[str, Any]]) -> None:
+    """Persist rows for `key`. Failures are ignored; the cache is best-effort."""
+    directory = cache_dir()
+    path = directory / f"{key}.json"
+    tmp = directory / f"{key}.{os.getpid()}.tmp"
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        with tmp.open("w", encoding="utf-8") as f:
+            json.dump({"mtime": time.time(), "rows": rows}, f)
+        os.replace(tmp, path)
+    except (OSError, TypeError, ValueError):
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
@@ -1,16 +1,31 @@
 from __future__ import annotations
 
 import sys
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 
-import boto3
-import botocore
 from ..config import resolved_aws_settings
 from ..exceptions import CredentialsNotFound, PermissionDenied, ServiceUnavailable
+from . import _cache
 
+# Shared read-only fallbacks for InstanceTypeInfo.from_aws, which runs once per row.
+_EMPTY: Mapping[str, Any] = {}
+_ENA_SUPPORTED = ("required", "supported")
 
-@dataclass(frozen=True)
+# AWS error codes mapped onto eigenangi exceptions.
+_PERMISSION_CODES = frozenset({"AccessDenied", "UnauthorizedOperation"})
+_TRANSIENT_CODES = frozenset(
+    {"Throttling", "RequestLimitExceeded", "ServiceUnavailable"}
+)
+
+# slots=True drops the per-instance __dict__; it is only accepted on 3.10+.
+_DATACLASS_OPTS: Dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTS)
 class InstanceTypeInfo:
     instance_type: str
     vcpu: int
@@ -24,12 +39,14 @@ class InstanceTypeInfo:
     @staticmethod
     def from_aws(d: Dict[str, Any]) -> "InstanceTypeInfo":
         it = d.get("InstanceType", "")
-        vcpu = d.get("VCpuInfo", {}).get("DefaultVCpus", 0)
-        mem = d.get("MemoryInfo", {}).get("SizeInMiB", 0)
-        family = it.split(".")[0] if "." in it else None
-        arch = d.get("ProcessorInfo", {}).get("SupportedArchitectures", None)
-        net_perf = d.get("NetworkInfo", {}).get("NetworkPerformance")
-        ena = d.get("NetworkInfo", {}).get("EnaSupport") in ("required", "supported")
+        dot = it.find(".")
+        net = d.get("NetworkInfo") or _EMPTY
+        vcpu = (d.get("VCpuInfo") or _EMPTY).get("DefaultVCpus", 0)
+        mem = (d.get("MemoryInfo") or _EMPTY).get("SizeInMiB", 0)
+        family = it[:dot] if dot >= 0 else None
+        arch = (d.get("ProcessorInfo") or _EMPTY).get("SupportedArchitectures")
+        net_perf = net.get("NetworkPerformance")
+        ena = net.get("EnaSupport") in _ENA_SUPPORTED
         burst = d.get("BurstablePerformanceSupported", False)
         return InstanceTypeInfo(
             instance_type=it,
@@ -49,27 +66,40 @@ class EC2Client:
     Auth/region resolution follows boto3 defaults plus eigenangi config helpers.
     """
 
-    def __init__(self, region_name: Optional[str] = None) -> None:
-        cfg = resolved_aws_settings()
-        region = region_name or cfg.get("AWS_DEFAULT_REGION")
-        try:
-            session = boto3.session.Session(
-                aws_access_key_id=cfg.get("AWS_ACCESS_KEY_ID") or None,
-                aws_secret_access_key=cfg.get("AWS_SECRET_ACCESS_KEY") or None,
-                aws_session_token=cfg.get("AWS_SESSION_TOKEN") or None,
-                region_name=region or None,
-            )
-        except Exception as e:
-            raise CredentialsNotFound(str(e)) from e
+    def __init__(
+        self, region_name: Optional[str] = None, *, session: Optional[Any] = None
+    ) -> None:
+        """
+        Args:
+            region_name: Region to query; defaults to env/config/profile resolution.
+            session: Optional existing boto3 Session to build the client from,
+                     so several regional clients can share one session.
+        """
+        if session is None:
+            # boto3 is imported lazily: loading it costs hundreds of ms, which
+            # `--help` and plain `import eigenangi` should not have to pay.
+            import boto3
+
+            cfg = resolved_aws_settings()
+            region = region_name or cfg.get("AWS_DEFAULT_REGION")
+            try:
+                session = boto3.session.Session(
+                    aws_access_key_id=cfg.get("AWS_ACCESS_KEY_ID") or None,
+                    aws_secret_access_key=cfg.get("AWS_SECRET_ACCESS_KEY") or None,
+                    aws_session_token=cfg.get("AWS_SESSION_TOKEN") or None,
+                    region_name=region or None,
+                )
+            except Exception as e:
+                raise CredentialsNotFound(str(e)) from e
 
         self._session = session
-        self._region = session.region_name
+        self._region = region_name or session.region_name
         if not self._region:
             raise CredentialsNotFound(
                 "AWS region not resolved. Set AWS_DEFAULT_REGION or configure your AWS profile."
             )
 
-        self._ec2 = session.client("ec2")
+        self._ec2 = session.client("ec2", region_name=self._region)
 
     @property
     def region(self) -> str:
@@ -81,6 +111,7 @@ class EC2Client:
         arch: Optional[str] = None,  # "arm64" | "x86_64"
         burstable_only: Optional[bool] = None,  # True | False | None
         max_results: int = 1000,
+        refresh: bool = False,
     ) -> List[InstanceTypeInfo]:
         """
         Discover instance types available to the account in this region.
@@ -90,69 +121,135 @@ class EC2Client:
                       e.g. ["t4g", "m7g"].
             arch:     Optional architecture filter: "arm64" | "x86_64".
             burstable_only: If True, only T-family (burstable). If False, exclude them.
-            max_results: Trim the returned list to at most this many items.
+            max_results: Return at most this many items; paging stops once reached.
+            refresh:  Ignore the on-disk cache (~/.cache/eigenangi) and query AWS.
+                      Results are cached per region/filters for 7 days by default
+                      (override with EIGENANGI_CACHE_TTL, in seconds).
 
         Returns:
             A list of InstanceTypeInfo objects.
         """
+        from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
+
+        if families:
+            families = sorted(set(families))
+
         filters: List[Dict[str, Any]] = []
         if families:
-            # NOTE: EC2 filter "instance-type" does not support wildcards reliably;
-            # many accounts use pagination anyway. We request broadly and filter client-side.
-            # If you prefer API-side filtering, you could expand to exact types.
-            pass
+            # Push the family filter down to the API ("t4g.*" patterns) so fewer
+            # pages come back. The client-side check below is kept in case the
+            # wildcard match is looser than the prefix-before-the-dot rule.
+            filters.append(
+                {"Name": "instance-type", "Values": [f"{f}.*" for f in families]}
+            )
 
         if arch:
             filters.append(
                 {"Name": "processor-info.supported-architecture", "Values": [arch]}
             )
 
+        if burstable_only is not None:
+            filters.append(
+                {
+                    "Name": "burstable-performance-supported",
+                    "Values": ["true" if burstable_only else "false"],
+                }
+            )
+
+        if max_results <= 0:
+            return []
+
+        cache_key = _cache.make_key(
+            self._region,
+            {
+                "families": families,
+                "arch": arch,
+                "burstable_only": burstable_only,
+                "max_results": max_results,
+            },
+        )
+        if not refresh:
+            cached = _cache.load(cache_key)
+            if cached is not None:
+                try:
+                    return [InstanceTypeInfo(**row) for row in cached]
+                except TypeError:
+                    pass  # stale schema; fall through and refetch
+
+        paginate_kwargs: Dict[str, Any] = {
+            # DescribeInstanceTypes accepts page sizes of 5..100.
+            "PaginationConfig": {"PageSize": max(5, min(100, max_results))},
+        }
+        if filters:
+            paginate_kwargs["Filters"] = filters
+
         try:
             paginator = self._ec2.get_paginator("describe_instance_types")
-            page_it = paginator.paginate(
-                Filters=filters if filters else None,
-                PaginationConfig={"PageSize": 100},
-            )
+            page_it = paginator.paginate(**paginate_kwargs)
 
+            fam_set = frozenset(families) if families else None
+
+            # Stop as soon as max_results rows are kept: the paginator is lazy,
+            # so pages past that point are never requested. MaxItems is not used
+            # because it counts rows before the client-side checks below.
             out: List[InstanceTypeInfo] = []
             for page in page_it:
                 for it in page.get("InstanceTypes", []):
-                    info = InstanceTypeInfo.from_aws(it)
-
-                    # Client-side family filter (prefix before the dot)
-                    if families:
-                        fam = info.family or ""
-                        if fam not in set(families):
+                    # Client-side family filter (prefix before the dot), checked on
+                    # the raw dict so rejected rows are never turned into objects.
+                    if fam_set is not None:
+                        name = it.get("InstanceType", "")
+                        dot = name.find(".")
+                        fam = name[:dot] if dot >= 0 else ""
+                        if fam not in fam_set:
                             continue
 
+                    info = InstanceTypeInfo.from_aws(it)
+
                     if burstable_only is True and not info.burstable:
                         continue
                     if burstable_only is False and info.burstable:
                         continue
 
                     out.append(info)
+                    if len(out) >= max_results:
+                        break
+                if len(out) >= max_results:
+                    break
 
-            return out[:max_results]
+            _cache.store(cache_key, [asdict(info) for info in out])
+            return out
 
-        except botocore.exceptions.NoCredentialsError as e:
+        except NoCredentialsError as e:
             raise CredentialsNotFound(
                 "AWS credentials not found. Set env vars, ~/.aws/credentials, or an IAM role."
             ) from e
-        except botocore.exceptions.ClientError as e:
-            code = e.response.get("Error", {}).get("Code", "")
-            if code in {"AccessDenied", "UnauthorizedOperation"}:
+        except ClientError as e:
+            code = (e.response.get("Error") or _EMPTY).get("Code") or ""
+            if code in _PERMISSION_CODES:
                 raise PermissionDenied(
                     f"Access denied for DescribeInstanceTypes: {code}"
                 ) from e
-            if code in {"Throttling", "RequestLimitExceeded", "ServiceUnavailable"}:
+            if code in _TRANSIENT_CODES:
                 raise ServiceUnavailable(
                     f"EC2 service throttled/unavailable: {code}"
                 ) from e
             raise
-        except botocore.exceptions.BotoCoreError as e:
+        except BotoCoreError as e:
             raise ServiceUnavailable(f"Boto core error: {e}") from e
 
 
+@lru_cache(maxsize=4)
+def _get_client(region_name: Optional[str] = None) -> EC2Client:
+    """Shared EC2Client per region for the convenience helpers below."""
+    return EC2Client(region_name=region_name)
+
+
+def _reset_clients() -> None:
+    """Drop cached clients (e.g. after changing credentials, or in tests)."""
+    _get_client.cache_clear()
+
+
 class _EC2Facade:
     """
     Convenience facade so callers can do:
@@ -165,7 +262,12 @@ class _EC2Facade:
         return EC2Client(*args, **kwargs)
 
     def list_machine_types(self, *args: Any, **kwargs: Any) -> List[InstanceTypeInfo]:
-        return EC2Client().list_machine_types(*args, **kwargs)
+        return list_machine_types(*args, **kwargs)
+
+    def list_machine_types_multi(
+        self, regions: Iterable[str], **kwargs: Any
+    ) -> Dict[str, List[InstanceTypeInfo]]:
+        return list_machine_types_multi(regions, **kwargs)
 
 
 # Singleton-style convenience export
@@ -173,8 +275,46 @@ ec2 = _EC2Facade()
 
 
 def list_machine_types(*args: Any, **kwargs: Any) -> List[InstanceTypeInfo]:
-    """Functional alias: eigenangi.ec2.list_machine_types(...)."""
-    return EC2Client().list_machine_types(*args, **kwargs)
+    """
+    Functional alias: eigenangi.ec2.list_machine_types(...).
+
+    Accepts an extra `region_name` keyword; the underlying EC2Client is
+    reused across calls for the same region.
+    """
+    region_name = kwargs.pop("region_name", None)
+    return _get_client(region_name).list_machine_types(*args, **kwargs)
+
+
+def list_machine_types_multi(
+    regions: Iterable[str], **kwargs: Any
+) -> Dict[str, List[InstanceTypeInfo]]:
+    """
+    Run list_machine_types across several regions concurrently.
+
+    One boto3 Session is shared and a client is created per region up front
+    (client creation is not thread-safe; using the clients is). Keyword
+    arguments are passed through to EC2Client.list_machine_types.
+
+    Returns:
+        A dict mapping each region to its list of InstanceTypeInfo, in the
+        order the regions were given.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    unique = list(dict.fromkeys(regions))
+    if not unique:
+        return {}
+    if kwargs.get("families") is not None:
+        kwargs["families"] = list(kwargs["families"])  # shared by every worker
+
+    first = EC2Client(region_name=unique[0])
+    clients = [first] + [
+        EC2Client(region_name=r, session=first._session) for r in unique[1:]
+    ]
+
+    with ThreadPoolExecutor(max_workers=min(len(clients), 16)) as pool:
+        futures = [pool.submit(c.list_machine_types, **kwargs) for c in clients]
+        return {r: f.result() for r, f in zip(unique, futures)}
 
 
 def _print_table(rows: List[InstanceTypeInfo]) -> None:
@@ -191,24 +331,35 @@ def _print_table(rows: List[InstanceTypeInfo]) -> None:
         "network",
         "burstable",
     ]
-    print("\t".join(headers))
-    for r in rows:
-        arch = ",".join(r.arch or []) if r.arch else ""
-        net = r.network_performance or ""
-        fam = r.family or ""
-        print(
-            f"{r.instance_type}\t{r.vcpu}\t{r.memory_mib}\t{fam}\t{arch}\t{net}\t{r.burstable}"
-        )
+    # Build the whole table and write it once rather than one print() per row.
+    lines = ["\t".join(headers)]
+    lines.extend(
+        f"{r.instance_type}\t{r.vcpu}\t{r.memory_mib}\t{r.family or ''}\t"
+        f"{','.join(r.arch) if r.arch else ''}\t{r.network_performance or ''}\t"
+        f"{r.burstable}"
+        for r in rows
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main(argv: Optional[List[str]] = None) -> int:
     import argparse
 
     parser = argparse.ArgumentParser(
-        prog="eigenangi-ec2", description="EC2 machine type discovery"
+        prog="eigenangi-ec2",
+        description="EC2 machine type discovery",
+        epilog=(
+            "Config: env vars, .env, then ~/.config/eigenangi/config.toml ([aws] "
+            "table). A ~/.config/eigenangi/config.py defining "
+            "AWS = {'AWS_DEFAULT_REGION': '...'} is used instead of the TOML "
+            "file when present."
+        ),
     )
     parser.add_argument("command", choices=["list-machine-types"])
-    parser.add_argument("--region", help="AWS region (overrides env/profile)")
+    parser.add_argument(
+        "--region",
+        help="AWS region (overrides env/profile); comma-separate to query several",
+    )
     parser.add_argument(
         "--family", action="append", help="Filter by instance family (repeatable)"
     )
@@ -222,11 +373,15 @@ def main(argv: Optional[List[str]] = None) -> int:
         "--non-burstable-only", action="store_true", help="Exclude burstable"
     )
     parser.add_argument("--limit", type=int, default=200, help="Max results")
+    parser.add_argument(
+        "--refresh", action="store_true", help="Bypass the local result cache"
+    )
 
     args = parser.parse_args(argv)
 
+    regions = [r.strip() for r in (args.region or "").split(",") if r.strip()]
+
     try:
-        client = EC2Client(region_name=args.region)
         if args.command == "list-machine-types":
             burstable: Optional[bool]
             if args.burstable_only:
@@ -236,13 +391,20 @@ def main(argv: Optional[List[str]] = None) -> int:
             else:
                 burstable = None
 
-            rows = client.list_machine_types(
+            opts: Dict[str, Any] = dict(
                 families=args.family,
                 arch=args.arch,
                 burstable_only=burstable,
                 max_results=args.limit,
+                refresh=args.refresh,
             )
-            _print_table(rows)
+            if len(regions) > 1:
+                for region, rows in list_machine_types_multi(regions, **opts).items():
+                    sys.stdout.write(f"# {region}\n")
+                    _print_table(rows)
+            else:
+                client = EC2Client(region_name=regions[0] if regions else None)
+                _print_table(client.list_machine_types(**opts))
         return 0
     except (CredentialsNotFound, PermissionDenied, ServiceUnavailable) as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -3,5 +3,7 @@ import os
 
 
 def getenv_str(name: str, default: Optional[str] = None) -> Optional[str]:
-    val = os.getenv(name)
-    return val if (val is not None and val.strip() != "") else default
+    # isspace() is False for "", hence the truthiness check; unlike strip()
+    # it does not allocate a new string.
+    val = os.environ.get(name)
+    return val if val and not val.isspace() else default
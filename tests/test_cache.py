@@ -0,0 +1,25 @@
+from eigenangi.ec2 import _cache
+
+
+def test_store_and_load_roundtrip(tmp_path, monkeypatch):
+    monkeypatch.setattr(_cache, "cache_dir", lambda: tmp_path)
+    key = _cache.make_key("ap-south-1", {"arch": "arm64"})
+    assert _cache.load(key) is None
+
+    rows = [{"instance_type": "t4g.micro", "vcpu": 2, "memory_mib": 1024}]
+    _cache.store(key, rows)
+    assert _cache.load(key) == rows
+
+
+def test_load_respects_ttl(tmp_path, monkeypatch):
+    monkeypatch.setattr(_cache, "cache_dir", lambda: tmp_path)
+    key = _cache.make_key("ap-south-1", {})
+    _cache.store(key, [])
+    monkeypatch.setenv("EIGENANGI_CACHE_TTL", "0")
+    assert _cache.load(key) is None
+
+
+def test_key_depends_on_region_and_filters():
+    a = _cache.make_key("ap-south-1", {"arch": "arm64"})
+    assert a != _cache.make_key("eu-west-1", {"arch": "arm64"})
+    assert a != _cache.make_key("ap-south-1", {"arch": "x86_64"})
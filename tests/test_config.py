@@ -0,0 +1,22 @@
+from eigenangi import config
+
+
+def test_resolved_aws_settings_is_cached(monkeypatch):
+    config.resolved_aws_settings.cache_clear()
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "ap-south-1")
+    first = config.resolved_aws_settings()
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "eu-west-1")
+    assert config.resolved_aws_settings() is first
+
+    config.resolved_aws_settings.cache_clear()
+    assert config.resolved_aws_settings()["AWS_DEFAULT_REGION"] == "eu-west-1"
+    config.resolved_aws_settings.cache_clear()
+
+
+def test_python_config_takes_precedence_over_toml(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "_config_dir", lambda: tmp_path)
+    (tmp_path / "config.toml").write_text('[aws]\nAWS_DEFAULT_REGION = "eu-west-1"\n')
+    assert config.load_toml_config() == {"AWS_DEFAULT_REGION": "eu-west-1"}
+
+    (tmp_path / "config.py").write_text('AWS = {"aws_default_region": "ap-south-1"}\n')
+    assert config.load_toml_config() == {"AWS_DEFAULT_REGION": "ap-south-1"}
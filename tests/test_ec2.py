@@ -2,12 +2,31 @@ import os
 import pytest
 
 from eigenangi.ec2 import ec2
+from eigenangi.ec2.ec2 import InstanceTypeInfo
 
 
 def test_imports():
     assert callable(ec2.list_machine_types)
 
 
+def test_from_aws_parses_and_tolerates_missing_keys():
+    info = InstanceTypeInfo.from_aws(
+        {
+            "InstanceType": "t4g.micro",
+            "VCpuInfo": {"DefaultVCpus": 2},
+            "MemoryInfo": {"SizeInMiB": 1024},
+            "ProcessorInfo": {"SupportedArchitectures": ["arm64"]},
+            "NetworkInfo": {"EnaSupport": "required"},
+            "BurstablePerformanceSupported": True,
+        }
+    )
+    assert (info.family, info.vcpu, info.memory_mib) == ("t4g", 2, 1024)
+    assert info.arch == ["arm64"] and info.supports_ena and info.burstable
+
+    bare = InstanceTypeInfo.from_aws({"InstanceType": "weird"})
+    assert bare.family is None and bare.vcpu == 0 and bare.supports_ena is False
+
+
 @pytest.mark.skipif(
     not os.getenv("AWS_DEFAULT_REGION"),
     reason="Set AWS_DEFAULT_REGION and credentials to run this live test",
@@ -15,3 +34,28 @@ def test_imports():
 def test_list_machine_types_live():
     out = ec2.list_machine_types()
     assert isinstance(out, list)
+
+
+def test_list_machine_types_stops_paging_at_max_results(tmp_path, monkeypatch):
+    from eigenangi.ec2 import _cache
+    from eigenangi.ec2.ec2 import EC2Client
+
+    monkeypatch.setattr(_cache, "cache_dir", lambda: tmp_path)
+    requested = []
+
+    def pages():
+        for n in range(3):
+            requested.append(n)
+            yield {"InstanceTypes": [{"InstanceType": f"m{n}.{i}"} for i in range(5)]}
+
+    class FakeEC2:
+        def get_paginator(self, name):
+            return type("P", (), {"paginate": lambda self, **kw: pages()})()
+
+    client = object.__new__(EC2Client)
+    client._region = "ap-south-1"
+    client._ec2 = FakeEC2()
+
+    out = client.list_machine_types(max_results=7, refresh=True)
+    assert [i.instance_type for i in out][-1] == "m1.1" and len(out) == 7
+    assert requested == [0, 1]